@@ -2,10 +2,11 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
+import math
 import pytest
 import pandas as pd
 import json
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
 import os
 
 from oss_fuzz_analysis import (
@@ -30,7 +31,7 @@ def sample_project_data():
         {"date": "15-01-2025", "crash_hash": "test123", "type": "null-pointer"}
     ])
     coverage_data = pd.DataFrame([
-        {"date": "15-01-2025", "coverage": 75.0}
+        {"date": pd.Timestamp("2025-01-15"), "coverage": 75.0}
     ])
     return {
         "test_project": {
@@ -53,16 +54,30 @@ def output_files():
         if os.path.exists(file):
             os.remove(file)
 
+def _mock_response(status_code, payload=None):
+    """Build a mock httpx response."""
+    response = Mock(status_code=status_code, headers={})
+    response.json.return_value = payload
+    return response
+
 def test_fetch_project_metadata():
     """Test project metadata fetching."""
-    with patch('requests.get') as mock_get:
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"name": "test_project"}
-        
+    with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = _mock_response(200, {"name": "test_project"})
+
         result = fetch_project_metadata(["test_project"])
         assert "test_project" in result
         assert result["test_project"]["name"] == "test_project"
 
+def test_fetch_project_metadata_multiple():
+    """Test that concurrent fetching returns results for all projects."""
+    with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = _mock_response(200, {"name": "test_project"})
+
+        projects = [f"project_{i}" for i in range(5)]
+        result = fetch_project_metadata(projects)
+        assert set(result) == set(projects)
+
 def test_fetch_project_data():
     """Test project data generation."""
     result = fetch_project_data(["zlib"])
@@ -83,12 +98,65 @@ def test_analyze_project_data(sample_project_data):
 def test_plot_coverage_trends(sample_project_data, output_files):
     """Test plot generation."""
     plot_coverage_trends(sample_project_data, ["test_project"])
-    assert os.path.exists("coverage_trends.png")
+    output_path = os.path.join(
+        os.path.dirname(__file__), "../outputs/coverage_trends.png"
+    )
+    assert os.path.exists(output_path)
+
+def test_analyze_project_data_string_dates():
+    """Test analysis of frames that still carry string dates."""
+    project_data = {
+        "legacy": {
+            "crashes": pd.DataFrame([
+                {"date": "15-01-2025", "crash_hash": "test123", "type": "null-pointer"}
+            ]),
+            "coverage": pd.DataFrame([
+                {"date": "15-01-2025", "coverage": 70.0},
+                {"date": "28-01-2025", "coverage": 77.0}
+            ])
+        }
+    }
+    result = analyze_project_data(project_data)
+    assert result["legacy"]["avg_coverage"] == pytest.approx(73.5)
+    trend = result["legacy"]["coverage_trend"]
+    assert [record["date"] for record in trend] == ["15-01-2025", "28-01-2025"]
+    assert trend[1]["growth_rate"] == pytest.approx(10.0)
+
+def test_analyze_project_data_empty_coverage():
+    """Test analysis of a project with no coverage rows."""
+    project_data = {
+        "empty_project": {
+            "crashes": pd.DataFrame([
+                {"date": "15-01-2025", "crash_hash": "test123", "type": "null-pointer"}
+            ]),
+            "coverage": pd.DataFrame({
+                "date": pd.Series(dtype="datetime64[s]"),
+                "coverage": pd.Series(dtype=float)
+            })
+        }
+    }
+    result = analyze_project_data(project_data)
+    assert result["empty_project"]["unique_crashes"] == 1
+    assert math.isnan(result["empty_project"]["avg_coverage"])
+    assert result["empty_project"]["coverage_trend"] == []
+
+def test_plot_invalid_backend(sample_project_data):
+    """Test that an unknown plot backend is rejected."""
+    with pytest.raises(ValueError, match="Unknown plot backend"):
+        plot_coverage_trends(sample_project_data, ["test_project"], backend="gnuplot")
+
+def test_plot_backend_auto_selection(sample_project_data):
+    """Test that auto selection hands large traces to an installed renderer."""
+    with patch('oss_fuzz_analysis.analyzer._LARGE_PLOT_THRESHOLD', 1), \
+         patch('importlib.util.find_spec', return_value=Mock()), \
+         patch('oss_fuzz_analysis.analyzer._plot_with_plotly_resampler') as mock_plot:
+        plot_coverage_trends(sample_project_data, ["test_project"])
+        mock_plot.assert_called_once()
 
 def test_invalid_project_metadata():
     """Test handling of invalid projects."""
-    with patch('requests.get') as mock_get:
-        mock_get.return_value.status_code = 404
+    with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = _mock_response(404)
         result = fetch_project_metadata(["invalid_project"])
         assert "invalid_project" in result
         assert result["invalid_project"]["error"] == "Project not found"
@@ -100,5 +168,7 @@ def test_coverage_data_format():
     
     assert "date" in coverage_df.columns
     assert "coverage" in coverage_df.columns
-    assert coverage_df["coverage"].dtype in [float, int]
-    assert coverage_df["date"].dtype == object
+    assert pd.api.types.is_numeric_dtype(coverage_df["coverage"])
+    assert coverage_df["coverage"].dtype.itemsize <= 2  # downcast storage
+    assert pd.api.types.is_datetime64_any_dtype(coverage_df["date"])
+    assert coverage_df["date"].is_monotonic_increasing